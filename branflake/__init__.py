@@ -8,11 +8,22 @@ result and then calling the `from_int(int)` class method.
 
 License: MIT. See LICENSE file for more details.
 """
-from base64 import b16encode, b16decode, urlsafe_b64encode, urlsafe_b64decode
-from time import time, gmtime
-from secrets import token_bytes
+try:
+    from pybase64 import urlsafe_b64encode, urlsafe_b64decode
+except ImportError:
+    from base64 import urlsafe_b64encode, urlsafe_b64decode
+from os import urandom
+from time import time_ns, gmtime
+from struct import Struct
 from uuid import UUID
-from math import ceil
+
+_U64 = Struct('>Q')
+_U128 = Struct('>QQ')
+_PACK_Q = _U64.pack
+_UNPACK_Q = _U64.unpack
+_PACK_QQ = _U128.pack
+_UNPACK_QQ = _U128.unpack
+_U64_MASK = (1 << 64) - 1
 
 class Branflake:
     """Encapsulates 128 bits of data, 64 of which correspond to microseconds
@@ -33,32 +44,46 @@ class Branflake:
         another_flake = Branflake.from_int(branflake_int)
     """
 
+    __slots__ = ('_time', '_random_bytes', '_random_int', '_int',
+                 '_time_bytes', '_bytes', '_hex_bytes', '_hex_string',
+                 '_base64_bytes', '_uuid')
+
     ONE_MILLION = 1000000
     TIME_BYTES_LEN = 8
     RANDOM_BYTES_LEN = 8
     TOTAL_BYTES_LEN = TIME_BYTES_LEN + RANDOM_BYTES_LEN
-    BASE64_LEN = ceil(TOTAL_BYTES_LEN * 4 / 3)
-    BASE64_PADDED_LEN = ceil(TOTAL_BYTES_LEN / 6) * 8
-    MICROSECONDS_MAX = (256 ** TIME_BYTES_LEN) - 1
-    BRANFLAKE_INT_MAX = (256 ** TOTAL_BYTES_LEN) - 1
+    BASE64_LEN = 22
+    BASE64_PADDED_LEN = 24
+    MICROSECONDS_MAX = (1 << 64) - 1
+    BRANFLAKE_INT_MAX = (1 << 128) - 1
 
     def __init__(self, microseconds=None, random_bytes=None):
-        if (microseconds
-                and ((microseconds < 1)
-                     or (microseconds > Branflake.MICROSECONDS_MAX))):
+        if microseconds is None:
+            self._time = time_ns() // 1000
+        elif not 1 <= microseconds <= Branflake.MICROSECONDS_MAX:
             raise ValueError('microseconds: value out of range')
-        if random_bytes and (len(random_bytes) != Branflake.RANDOM_BYTES_LEN):
+        else:
+            self._time = int(microseconds)
+        if random_bytes is None:
+            self._random_bytes = urandom(Branflake.RANDOM_BYTES_LEN)
+        elif len(random_bytes) != Branflake.RANDOM_BYTES_LEN:
             raise ValueError('random_bytes: incorrect length')
-
-        self._time = int(microseconds or (time() * Branflake.ONE_MILLION))
-        self._random_bytes = random_bytes or token_bytes(Branflake.RANDOM_BYTES_LEN)
+        else:
+            self._random_bytes = random_bytes
+        self._random_int = _UNPACK_Q(self._random_bytes)[0]
+        self._int = (self._time << 64) | self._random_int
+        self._bytes = None
+        self._hex_bytes = None
+        self._hex_string = None
+        self._base64_bytes = None
+        self._uuid = None
         self._set_time_bytes()
 
     def __str__(self):
-        return str(self.to_int())
+        return str(self._int)
 
     def __repr__(self):
-        return '<Branflake %r>' % self.to_int()
+        return '<Branflake %r>' % self._int
 
     @classmethod
     def from_int(cls, branflake_int):
@@ -70,8 +95,9 @@ class Branflake:
         if (branflake_int < 0) or (branflake_int > Branflake.BRANFLAKE_INT_MAX):
             raise ValueError('branflake_int: value out of range')
 
-        all_bytes = branflake_int.to_bytes(Branflake.TOTAL_BYTES_LEN, byteorder='big', signed=False)
-        return cls.from_bytes(all_bytes)
+        microseconds = branflake_int >> 64
+        random_bytes = _PACK_Q(branflake_int & _U64_MASK)
+        return cls(microseconds, random_bytes)
 
     @classmethod
     def from_hex_string(cls, branflake_hex_string):
@@ -85,7 +111,7 @@ class Branflake:
         if len(branflake_hex_string) != Branflake.TOTAL_BYTES_LEN * 2:
             raise ValueError('branflake_hex_string: incorrect length')
 
-        all_bytes = b16decode(branflake_hex_string)
+        all_bytes = bytes.fromhex(branflake_hex_string)
         return cls.from_bytes(all_bytes)
 
     @classmethod
@@ -97,14 +123,17 @@ class Branflake:
             branflake_base64_string: A 22-character URL-safe base64-encoded `string`
             returned from another `Branflake`
         """
-        if len(branflake_base64_string) < Branflake.BASE64_LEN:
+        length = len(branflake_base64_string)
+        if length < Branflake.BASE64_LEN:
             raise ValueError('branflake_base64_string: incorrect length')
-        if len(branflake_base64_string) > Branflake.BASE64_PADDED_LEN:
+        if length > Branflake.BASE64_PADDED_LEN:
             raise ValueError('branflake_base64_string: incorrect length')
 
-        all_bytes = urlsafe_b64decode(
-            branflake_base64_string.ljust(Branflake.BASE64_PADDED_LEN, '=')
-        )
+        if length == Branflake.BASE64_LEN:
+            branflake_base64_string += '=='
+        elif length != Branflake.BASE64_PADDED_LEN:
+            branflake_base64_string += '='
+        all_bytes = urlsafe_b64decode(branflake_base64_string.encode('ascii'))
         return cls.from_bytes(all_bytes)
 
     @classmethod
@@ -118,12 +147,44 @@ class Branflake:
         if len(branflake_bytes) != Branflake.TOTAL_BYTES_LEN:
             raise ValueError('branflake_bytes: incorrect length')
 
-        time_bytes = branflake_bytes[0:Branflake.TIME_BYTES_LEN]
-        microseconds = int.from_bytes(
-            time_bytes, byteorder='big', signed=False)
+        microseconds = _UNPACK_QQ(branflake_bytes)[0]
         random_bytes = branflake_bytes[Branflake.TIME_BYTES_LEN:Branflake.TOTAL_BYTES_LEN]
         return cls(microseconds, random_bytes)
 
+    @classmethod
+    def generate_many(cls, count):
+        """Returns a list of `count` new `Branflake` objects sharing one
+        random-bytes draw and one clock read.
+
+        The random parts are carved from a single `os.urandom` call, and
+        the time parts increase by one microsecond per `Branflake`, so
+        the results are monotonic in the order generated.
+
+        Args:
+            count: The number of `Branflake` objects to generate
+        """
+        if count < 0:
+            raise ValueError('count: value out of range')
+
+        buffer = urandom(Branflake.RANDOM_BYTES_LEN * count)
+        base = time_ns() // 1000
+        return [
+            cls(base + i,
+                buffer[i * Branflake.RANDOM_BYTES_LEN:
+                       (i + 1) * Branflake.RANDOM_BYTES_LEN])
+            for i in range(count)
+        ]
+
+    @classmethod
+    def encode_many_base64(cls, flakes):
+        """Returns a list of 22-character URL-safe base64-encoded `string`
+        objects, one per `Branflake`.
+
+        Args:
+            flakes: An iterable of `Branflake` objects to encode
+        """
+        return [flake.to_base64_string() for flake in flakes]
+
     @classmethod
     def uuid(cls):
         """Returns the `UUID` corresponding to a newly created `Branflake`.
@@ -137,7 +198,7 @@ class Branflake:
 
     def to_gmtime(self):
         """Returns a time structure corresponding to the Branflake."""
-        return gmtime(self.to_seconds())
+        return gmtime(self._time / Branflake.ONE_MILLION)
 
     def to_microseconds(self):
         """Returns an `int` corresponding to the epoch time in microseconds
@@ -156,31 +217,40 @@ class Branflake:
 
     def to_bytes(self):
         """Returns a 16-byte array corresponding to the Branflake."""
-        return self.get_time_bytes() + self.get_random_bytes()
+        if self._bytes is None:
+            self._bytes = _PACK_QQ(self._time, self._random_int)
+        return self._bytes
 
     def to_hex_bytes(self):
         """Returns a 32-byte hexidecimal-encoded array corresponding
         to the Branflake."""
-        return b16encode(self.to_bytes())
+        if self._hex_bytes is None:
+            self._hex_bytes = self.to_hex_string().encode('ascii')
+        return self._hex_bytes
 
     def to_base64_bytes(self):
         """Returns a 24-byte URL-safe base64-encoded array corresponding
         to the Branflake."""
-        return urlsafe_b64encode(self.to_bytes())
+        if self._base64_bytes is None:
+            self._base64_bytes = urlsafe_b64encode(self.to_bytes())
+        return self._base64_bytes
 
     def to_int(self):
         """Returns a 128-bit `int` corresponding to the Branflake."""
-        return int.from_bytes(
-            self.to_bytes(), byteorder='big', signed=False)
+        return self._int
 
     def to_uuid(self):
         """Returns a UUID corresponding to the Branflake."""
-        return UUID(bytes=self.to_bytes())
+        if self._uuid is None:
+            self._uuid = UUID(int=self._int)
+        return self._uuid
 
     def to_hex_string(self):
         """Returns a 32-character hexidecimal-encoded `string`
         corresponding to the Branflake."""
-        return self.to_hex_bytes().decode('utf-8')
+        if self._hex_string is None:
+            self._hex_string = self.to_bytes().hex()
+        return self._hex_string
 
     def to_base64_string(self):
         """Returns a 22-character URL-safe base64-encoded `string`
@@ -188,5 +258,11 @@ class Branflake:
         return self.to_base64_bytes().decode('utf-8')[0:Branflake.BASE64_LEN]
 
     def _set_time_bytes(self):
-        self._time_bytes = self.to_microseconds().to_bytes(
-            Branflake.TIME_BYTES_LEN, byteorder='big', signed=False)
+        self._time_bytes = _PACK_Q(self._time)
+
+
+# Prefer the compiled class when the optional Cython extension was built.
+try:
+    from branflake._core import Branflake
+except ImportError:
+    pass
@@ -0,0 +1,260 @@
+# cython: language_level=3
+"""module: branflake._core
+
+Optional compiled implementation of `Branflake`. Built when Cython is
+available at install time; `branflake` falls back to the pure-Python
+class otherwise. Keep the behavior here in sync with
+`branflake/__init__.py`.
+
+License: MIT. See LICENSE file for more details.
+"""
+from libc.stdint cimport uint64_t
+
+try:
+    from pybase64 import urlsafe_b64encode, urlsafe_b64decode
+except ImportError:
+    from base64 import urlsafe_b64encode, urlsafe_b64decode
+from os import urandom
+from time import time_ns, gmtime
+from struct import Struct
+from uuid import UUID
+
+_U64 = Struct('>Q')
+_U128 = Struct('>QQ')
+_PACK_Q = _U64.pack
+_UNPACK_Q = _U64.unpack
+_PACK_QQ = _U128.pack
+_UNPACK_QQ = _U128.unpack
+_U64_MASK = (1 << 64) - 1
+
+
+cdef class Branflake:
+    """Encapsulates 128 bits of data, 64 of which correspond to microseconds
+    since the beginning of the epoch, and 64 of which are random.
+
+    microseconds: A 64-bit `int` corresponding to the time part of the
+    `Branflake`. If omitted, the current time is used.
+
+    random_bytes: A 8-byte array corresponding to the random part of the
+    `Branflake`. If omitted, it is generated at random.
+
+    Usage: # Create flake flake = Branflake()
+
+        # Store flake as `int`
+        branflake_int = flake.to_int()
+
+        # Reuse flake stored as `int`
+        another_flake = Branflake.from_int(branflake_int)
+    """
+
+    cdef uint64_t _time
+    cdef object _int
+    cdef bytes _random_bytes
+    cdef bytes _time_bytes
+    cdef bytes _bytes
+    cdef bytes _hex_bytes
+    cdef str _hex_string
+    cdef bytes _base64_bytes
+    cdef object _uuid
+
+    ONE_MILLION = 1000000
+    TIME_BYTES_LEN = 8
+    RANDOM_BYTES_LEN = 8
+    TOTAL_BYTES_LEN = 16
+    BASE64_LEN = 22
+    BASE64_PADDED_LEN = 24
+    MICROSECONDS_MAX = (1 << 64) - 1
+    BRANFLAKE_INT_MAX = (1 << 128) - 1
+
+    def __init__(self, microseconds=None, random_bytes=None):
+        if microseconds is None:
+            self._time = <uint64_t>(time_ns() // 1000)
+        elif not 1 <= microseconds <= Branflake.MICROSECONDS_MAX:
+            raise ValueError('microseconds: value out of range')
+        else:
+            self._time = <uint64_t>int(microseconds)
+        if random_bytes is None:
+            self._random_bytes = urandom(8)
+        elif len(random_bytes) != 8:
+            raise ValueError('random_bytes: incorrect length')
+        else:
+            self._random_bytes = bytes(random_bytes)
+        random_int = _UNPACK_Q(self._random_bytes)[0]
+        self._int = ((<object>self._time) << 64) | random_int
+        self._time_bytes = _PACK_Q(self._time)
+
+    def __str__(self):
+        return str(self._int)
+
+    def __repr__(self):
+        return '<Branflake %r>' % self._int
+
+    @classmethod
+    def from_int(cls, branflake_int):
+        """Returns a new `Branflake` corresponding to a 128-bit `int`.
+
+        Args:
+            branflake_int: A 128-bit `int` returned from another `Branflake`
+        """
+        if (branflake_int < 0) or (branflake_int > Branflake.BRANFLAKE_INT_MAX):
+            raise ValueError('branflake_int: value out of range')
+
+        microseconds = branflake_int >> 64
+        random_bytes = _PACK_Q(branflake_int & _U64_MASK)
+        return cls(microseconds, random_bytes)
+
+    @classmethod
+    def from_hex_string(cls, branflake_hex_string):
+        """Returns a new `Branflake` corresponding to a 32-character
+        hexidecimal-encoded `string`.
+
+        Args:
+            branflake_hex_string: A 32-character hexidecimal-encoded `string`
+            returned from another `Branflake`
+        """
+        if len(branflake_hex_string) != 32:
+            raise ValueError('branflake_hex_string: incorrect length')
+
+        all_bytes = bytes.fromhex(branflake_hex_string)
+        return cls.from_bytes(all_bytes)
+
+    @classmethod
+    def from_base64_string(cls, branflake_base64_string: str):
+        """Returns a new `Branflake` corresponding to a 22-character
+        URL-safe base64-encoded `string`.
+
+        Args:
+            branflake_base64_string: A 22-character URL-safe base64-encoded `string`
+            returned from another `Branflake`
+        """
+        length = len(branflake_base64_string)
+        if length < 22:
+            raise ValueError('branflake_base64_string: incorrect length')
+        if length > 24:
+            raise ValueError('branflake_base64_string: incorrect length')
+
+        if length == 22:
+            branflake_base64_string += '=='
+        elif length != 24:
+            branflake_base64_string += '='
+        all_bytes = urlsafe_b64decode(branflake_base64_string.encode('ascii'))
+        return cls.from_bytes(all_bytes)
+
+    @classmethod
+    def from_bytes(cls, branflake_bytes):
+        """Returns a new `Branflake` corresponding to a 16-byte array.
+
+        Args:
+            branflake_hex_string: A 16-byte array returned from another
+            `Branflake`
+        """
+        if len(branflake_bytes) != 16:
+            raise ValueError('branflake_bytes: incorrect length')
+
+        microseconds = _UNPACK_QQ(branflake_bytes)[0]
+        random_bytes = branflake_bytes[8:16]
+        return cls(microseconds, random_bytes)
+
+    @classmethod
+    def generate_many(cls, count):
+        """Returns a list of `count` new `Branflake` objects sharing one
+        random-bytes draw and one clock read.
+
+        The random parts are carved from a single `os.urandom` call, and
+        the time parts increase by one microsecond per `Branflake`, so
+        the results are monotonic in the order generated.
+
+        Args:
+            count: The number of `Branflake` objects to generate
+        """
+        if count < 0:
+            raise ValueError('count: value out of range')
+
+        buffer = urandom(8 * count)
+        base = time_ns() // 1000
+        return [
+            cls(base + i, buffer[i * 8:(i + 1) * 8])
+            for i in range(count)
+        ]
+
+    @classmethod
+    def encode_many_base64(cls, flakes):
+        """Returns a list of 22-character URL-safe base64-encoded `string`
+        objects, one per `Branflake`.
+
+        Args:
+            flakes: An iterable of `Branflake` objects to encode
+        """
+        return [flake.to_base64_string() for flake in flakes]
+
+    @classmethod
+    def uuid(cls):
+        """Returns the `UUID` corresponding to a newly created `Branflake`.
+        """
+        return cls().to_uuid()
+
+    def to_seconds(self):
+        """Returns a `float` corresponding to the epoch time in seconds
+        of the Branflake."""
+        return self._time / 1000000
+
+    def to_gmtime(self):
+        """Returns a time structure corresponding to the Branflake."""
+        return gmtime(self._time / 1000000)
+
+    def to_microseconds(self):
+        """Returns an `int` corresponding to the epoch time in microseconds
+        of the Branflake."""
+        return self._time
+
+    def get_time_bytes(self):
+        """Returns an 8-byte array corresponding to the time part of the
+        Branflake."""
+        return self._time_bytes
+
+    def get_random_bytes(self):
+        """Returns an 8-byte array corresponding to the random part of the
+        Branflake."""
+        return self._random_bytes
+
+    def to_bytes(self):
+        """Returns a 16-byte array corresponding to the Branflake."""
+        if self._bytes is None:
+            self._bytes = self._time_bytes + self._random_bytes
+        return self._bytes
+
+    def to_hex_bytes(self):
+        """Returns a 32-byte hexidecimal-encoded array corresponding
+        to the Branflake."""
+        if self._hex_bytes is None:
+            self._hex_bytes = self.to_hex_string().encode('ascii')
+        return self._hex_bytes
+
+    def to_base64_bytes(self):
+        """Returns a 24-byte URL-safe base64-encoded array corresponding
+        to the Branflake."""
+        if self._base64_bytes is None:
+            self._base64_bytes = urlsafe_b64encode(self.to_bytes())
+        return self._base64_bytes
+
+    def to_int(self):
+        """Returns a 128-bit `int` corresponding to the Branflake."""
+        return self._int
+
+    def to_uuid(self):
+        """Returns a UUID corresponding to the Branflake."""
+        if self._uuid is None:
+            self._uuid = UUID(int=self._int)
+        return self._uuid
+
+    def to_hex_string(self):
+        """Returns a 32-character hexidecimal-encoded `string`
+        corresponding to the Branflake."""
+        if self._hex_string is None:
+            self._hex_string = self.to_bytes().hex()
+        return self._hex_string
+
+    def to_base64_string(self):
+        """Returns a 22-character URL-safe base64-encoded `string`
+        corresponding to the Branflake."""
+        return self.to_base64_bytes().decode('utf-8')[0:22]
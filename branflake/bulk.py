@@ -0,0 +1,65 @@
+"""module: branflake.bulk
+
+Bulk generation of Branflake halves into NumPy arrays for data-engineering
+pipelines that need millions of IDs without per-object Python overhead.
+Requires `numpy`; when `numba` is also installed, the fill loop is JIT
+compiled and parallelized. Neither is required by the core `branflake`
+package.
+
+The random halves come from NumPy's PRNG, which is not cryptographically
+secure. Use `Branflake.generate_many` when the `secrets`-grade randomness
+of the core class is required.
+
+License: MIT. See LICENSE file for more details.
+"""
+from time import time_ns
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def fill_flakes(out_u64, time_base, random_u64):
+    """Fills a `(count, 2)` uint64 array with Branflake halves.
+
+    Column 0 receives `time_base + i` microseconds and column 1 receives
+    the supplied random words, so each row holds the two 64-bit halves of
+    one Branflake.
+
+    Args:
+        out_u64: A `(count, 2)` uint64 array to fill
+        time_base: A 64-bit `int` of microseconds for the first row
+        random_u64: A `(count,)` uint64 array of random words
+    """
+    for i in prange(out_u64.shape[0]):
+        out_u64[i, 0] = time_base + i
+        out_u64[i, 1] = random_u64[i]
+
+
+if njit is not None:
+    fill_flakes = njit(cache=True, parallel=True)(fill_flakes)
+
+
+def generate_array(count):
+    """Returns a `(count, 2)` uint64 array of Branflake halves.
+
+    The random words are drawn in a single PRNG call and the clock is
+    read once, with the time column increasing by one microsecond per
+    row, mirroring `Branflake.generate_many`.
+
+    Args:
+        count: The number of rows to generate
+    """
+    if count < 0:
+        raise ValueError('count: value out of range')
+
+    rng = np.random.default_rng()
+    random_u64 = rng.integers(
+        (2 ** 64) - 1, size=count, dtype=np.uint64, endpoint=True)
+    out_u64 = np.empty((count, 2), dtype=np.uint64)
+    fill_flakes(out_u64, time_ns() // 1000, random_u64)
+    return out_u64
@@ -0,0 +1,16 @@
+"""Build script for branflake.
+
+Packaging metadata lives in pyproject.toml. This script only wires up
+the optional Cython extension: when Cython is available at build time,
+`branflake._core` is compiled and used in place of the pure-Python
+class; otherwise the build is pure Python.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['branflake/_core.pyx'])
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -82,9 +82,30 @@ def test_out_of_bounds():
         Branflake(HIGH_INT64 + 1, HIGH_BYTEARRAY)
     with pytest.raises(ValueError):
         Branflake(-1, HIGH_BYTEARRAY)
+    with pytest.raises(ValueError):
+        Branflake(0, HIGH_BYTEARRAY)
     with pytest.raises(ValueError):
         Branflake.from_int(-1)
 
+def test_generate_many():
+    """ Tests generating branflakes in bulk.
+    """
+    flakes = Branflake.generate_many(10)
+    assert len(flakes) == 10
+    ints = [flake.to_int() for flake in flakes]
+    assert ints == sorted(ints)
+    assert len(set(ints)) == 10
+    with pytest.raises(ValueError):
+        Branflake.generate_many(-1)
+
+def test_encode_many_base64():
+    """ Tests encoding branflakes to base64 in bulk.
+    """
+    flakes = Branflake.generate_many(10)
+    strings = Branflake.encode_many_base64(flakes)
+    assert strings == [flake.to_base64_string() for flake in flakes]
+    assert all(len(string) == 22 for string in strings)
+
 def test_wrong_length():
     """ Tests creating branflakes with inputs of wrong length.
     """
@@ -0,0 +1,27 @@
+""" test_bulk.py
+"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from branflake import Branflake
+from branflake import bulk
+
+def test_generate_array():
+    """ Tests generating branflake halves in bulk.
+    """
+    halves = bulk.generate_array(10)
+    assert halves.shape == (10, 2)
+    assert halves.dtype == np.uint64
+    times = halves[:, 0].tolist()
+    assert times == sorted(times)
+    with pytest.raises(ValueError):
+        bulk.generate_array(-1)
+
+def test_round_trip():
+    """ Reconstitutes a branflake from a generated row.
+    """
+    halves = bulk.generate_array(1)
+    flake_int = (int(halves[0, 0]) << 64) | int(halves[0, 1])
+    flake = Branflake.from_int(flake_int)
+    assert flake.to_microseconds() == int(halves[0, 0])